@@ -53,7 +53,7 @@ import logging
 import typing
 from typing import Any, Dict, List, Literal, Optional, Tuple, TypedDict  # noqa: F401
 
-from ops.charm import CharmBase, HookEvent, RelationBrokenEvent, RelationEvent
+from ops.charm import CharmBase, HookEvent, RelationEvent
 from ops.framework import BoundEvent, EventSource, Object, ObjectEvents, StoredState
 from ops.model import Application, ModelError, Relation
 
@@ -73,20 +73,6 @@ RELATION_INTERFACE = "s3"
 logger = logging.getLogger(__name__)
 
 
-try:
-    import jsonschema
-
-    DO_VALIDATION = True
-except ModuleNotFoundError:
-    logger.warning(
-        "The `ingress` library needs the `jsonschema` package to be able "
-        "to do runtime data validation; without it, it will still work but validation "
-        "will be disabled. \n"
-        "It is recommended to add `jsonschema` to the 'requirements.txt' of your charm, "
-        "which will enable this feature."
-    )
-    DO_VALIDATION = False
-
 OBJECT_STORAGE_PROVIDES_APP_SCHEMA = {
     "$schema": "https://json-schema.org/draft/2019-09/schema",
     "$id": "https://canonical.github.io/charm-relation-interfaces/interfaces/s3/schemas/provider.json",
@@ -95,7 +81,7 @@ OBJECT_STORAGE_PROVIDES_APP_SCHEMA = {
     "type": "object",
     "default": {},
     "required": ["bucket", "access-key", "secret-key", "endpoint"],
-    "additionalProperties": "true",
+    "additionalProperties": True,
     "properties": {
         "bucket": {
             "title": "Bucket name",
@@ -164,7 +150,6 @@ OBJECT_STORAGE_PROVIDES_APP_SCHEMA = {
             "title": "S3 API signature",
             "description": "S3 protocol specific API signature.",
             "type": "integer",
-            "default": "",
             "enum": [2, 4],
             "examples": [2, 4],
         },
@@ -209,7 +194,7 @@ ANONYMOUS_OBJECT_STORAGE_REQUIRES_APP_SCHEMA = {
     "type": "object",
     "default": {},
     "required": ["bucket"],
-    "additionalProperties": "true",
+    "additionalProperties": True,
     "properties": {
         "bucket": {
             "title": "Bucket Name",
@@ -250,15 +235,125 @@ ProviderData = TypedDict(
 ProviderApplicationData = TypedDict("ProviderApplicationData", {"ingress": ProviderData})  # type: ignore
 
 
+# The fields a requirer reads back from the provider's databag.
+_REQUIRER_FIELDS = ("access-key", "bucket", "endpoint", "secret-key")
+
+
+def _endpoints_fingerprint(data: Dict[str, str]) -> str:
+    """A deterministic fingerprint of an endpoints dict.
+
+    Stable across processes (unlike `hash()`), so it can be persisted in
+    StoredState and compared on the next hook invocation.
+    """
+    if not data:
+        return ""
+    return "\n".join(data.get(f, "") for f in _REQUIRER_FIELDS)
+
+_PROVIDER_STRING_FIELDS = (
+    "bucket",
+    "access-key",
+    "secret-key",
+    "path",
+    "endpoint",
+    "region",
+    "s3-uri-style",
+    "storage-class",
+)
+_PROVIDER_STRING_LIST_FIELDS = ("tls-ca-chain", "attributes")
+
+
+def _validate_provider(data, schema):
+    """Specialized validator for OBJECT_STORAGE_PROVIDES_APP_SCHEMA."""
+    if not isinstance(data, dict):
+        raise DataValidationError(data, schema)
+    for key in ("bucket", "access-key", "secret-key", "endpoint"):
+        if key not in data:
+            raise DataValidationError(data, schema)
+    for key in _PROVIDER_STRING_FIELDS:
+        if key in data and not isinstance(data[key], str):
+            raise DataValidationError(data, schema)
+    for key in _PROVIDER_STRING_LIST_FIELDS:
+        if key in data:
+            value = data[key]
+            if not isinstance(value, list) or not all(isinstance(x, str) for x in value):
+                raise DataValidationError(data, schema)
+    if "s3-api-version" in data and data["s3-api-version"] not in (2, 4):
+        raise DataValidationError(data, schema)
+
+
+def _validate_requirer(data, schema):
+    """Specialized validator for ANONYMOUS_OBJECT_STORAGE_REQUIRES_APP_SCHEMA."""
+    if (
+        not isinstance(data, dict)
+        or "bucket" not in data
+        or not isinstance(data["bucket"], str)
+    ):
+        raise DataValidationError(data, schema)
+
+
+# The databags exchanged over this interface are small flat dicts, so the two
+# schemas shipped with this library are checked with specialized validators:
+# this keeps `jsonschema` (a few hundred ms of import and schema compilation)
+# out of the hook hot path entirely. Unknown schemas fall back to jsonschema.
+_SPECIALIZED_VALIDATORS = {
+    id(OBJECT_STORAGE_PROVIDES_APP_SCHEMA): _validate_provider,
+    id(ANONYMOUS_OBJECT_STORAGE_REQUIRES_APP_SCHEMA): _validate_requirer,
+}
+
+# Cached jsonschema validators for the fallback path, keyed on schema identity.
+_VALIDATORS: "Dict[int, Any]" = {}
+
+# Tri-state: None until the first fallback validation attempts the import, then
+# True/False. Keeps jsonschema's import cost (and the missing-package warning)
+# to at most once per hook process, and only when actually needed.
+DO_VALIDATION: Optional[bool] = None
+_jsonschema = None
+
+
 def _validate_data(data, schema):
     """Checks whether `data` matches `schema`.
 
     Will raise DataValidationError if the data is not valid, else return None.
     """
+    specialized = _SPECIALIZED_VALIDATORS.get(id(schema))
+    if specialized is not None:
+        specialized(data, schema)
+        return
+
+    global DO_VALIDATION, _jsonschema
+    if DO_VALIDATION is None:
+        try:
+            import jsonschema as _jsonschema
+
+            DO_VALIDATION = True
+        except ModuleNotFoundError:
+            logger.warning(
+                "The `object_storage` library needs the `jsonschema` package to be able "
+                "to do runtime data validation; without it, it will still work but validation "
+                "will be disabled. \n"
+                "It is recommended to add `jsonschema` to the 'requirements.txt' of your charm, "
+                "which will enable this feature."
+            )
+            DO_VALIDATION = False
     if not DO_VALIDATION:
         return
+    jsonschema = _jsonschema
+
+    validator = _VALIDATORS.get(id(schema))
+    if validator is None:
+        jsonschema.Draft7Validator.check_schema(schema)
+        try:
+            # Pin an empty local registry so validator construction never falls
+            # back to resolving (or fetching) remote meta-schemas for `$id`s.
+            from referencing import Registry
+
+            validator = jsonschema.Draft7Validator(schema, registry=Registry())
+        except (ImportError, TypeError):
+            # Older jsonschema without `referencing` support.
+            validator = jsonschema.Draft7Validator(schema)
+        _VALIDATORS[id(schema)] = validator
     try:
-        jsonschema.validate(instance=data, schema=schema)
+        validator.validate(data)
     except jsonschema.ValidationError as e:
         raise DataValidationError(data, schema) from e
 
@@ -280,8 +375,9 @@ class _ObjectStorageBase(Object):
 
         observe = self.framework.observe
         rel_events = charm.on[relation_name]
+        # relation-joined is always followed by relation-changed, so observing it
+        # too would only run the handler (and its relation-get) twice per update.
         observe(rel_events.relation_created, self._handle_relation)
-        observe(rel_events.relation_joined, self._handle_relation)
         observe(rel_events.relation_changed, self._handle_relation)
         observe(rel_events.relation_broken, self._handle_relation_broken)
         observe(charm.on.leader_elected, self._handle_upgrade_or_leader)  # type: ignore
@@ -290,7 +386,8 @@ class _ObjectStorageBase(Object):
     @property
     def relations(self):
         """The list of Relation instances associated with this endpoint."""
-        return list(self.charm.model.relations[self.relation_name])
+        # ops already hands back a list; no need to copy it on every access.
+        return self.charm.model.relations[self.relation_name]
 
     def _handle_relation(self, event):
         """Subclasses should implement this method to handle a relation update."""
@@ -307,12 +404,20 @@ class _ObjectStorageBase(Object):
 
 # Shamelessly taken from traefik_k8s.ingress -- it's a nice pattern!
 class _ObjectStorageEvent(RelationEvent):
+    # Empty slots here let subclasses declare their known attributes as slots;
+    # ops' EventBase still provides a __dict__ for anything else.
+    __slots__ = ()
+
     __args__ = ()  # type: Tuple[str, ...]
     __optional_kwargs__ = {}  # type: Dict[str, Any]
 
-    @classmethod
-    def __attrs__(cls):
-        return cls.__args__ + tuple(cls.__optional_kwargs__.keys())
+    # The full attribute tuple, computed once per subclass rather than on every
+    # snapshot/restore (which run for each deferred event replayed at hook start).
+    _attrs_cache = ()  # type: Tuple[str, ...]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._attrs_cache = cls.__args__ + tuple(cls.__optional_kwargs__.keys())
 
     def __init__(self, handle, relation, *args, **kwargs):
         super().__init__(handle, relation)
@@ -322,13 +427,14 @@ class _ObjectStorageEvent(RelationEvent):
 
         for attr, obj in zip(self.__args__, args):
             setattr(self, attr, obj)
-        for attr, default in self.__optional_kwargs__.items():
+        optional = type(self).__optional_kwargs__
+        for attr, default in optional.items():
             obj = kwargs.get(attr, default)
             setattr(self, attr, obj)
 
     def snapshot(self) -> dict:
         dct = super().snapshot()
-        for attr in self.__attrs__():
+        for attr in self._attrs_cache:
             obj = getattr(self, attr)
             try:
                 dct[attr] = obj
@@ -350,6 +456,7 @@ class _ObjectStorageEvent(RelationEvent):
 class ObjectStorageDataProvidedEvent(_ObjectStorageEvent):
     """Event representing that object storage data has been provided for an app."""
 
+    __slots__ = ("bucket",)
     __optional_kwargs__ = {"bucket": ""}  # type: ignore
 
     if typing.TYPE_CHECKING:
@@ -383,23 +490,27 @@ class _ObjectStorageProviderBase(_ObjectStorageBase):
         refresh_event: Optional[BoundEvent] = None,
     ):
         super().__init__(charm, relation_name)
-        if not refresh_event:
-            container = list(self.charm.meta.containers.values())[0]
-            if len(self.charm.meta.containers) == 1:
-                refresh_event = self.charm.on[container.name.replace("-", "_")].pebble_ready
-            else:
-                logger.warning(
-                    "%d containers are present in metadata.yaml and "
-                    "refresh_event was not specified. Defaulting to update_status. ",
-                    len(self.charm.meta.containers),
-                )
-                refresh_event = self.charm.on.update_status
+        if refresh_event:
+            self.framework.observe(refresh_event, self._handle_refresh)
+            return
+
+        containers = self.charm.meta.containers
+        if len(containers) == 1:
+            container = next(iter(containers.values()))
+            refresh_event = self.charm.on[container.name.replace("-", "_")].pebble_ready
+        else:
+            logger.warning(
+                "%d containers are present in metadata.yaml and "
+                "refresh_event was not specified. Defaulting to update_status. ",
+                len(containers),
+            )
+            refresh_event = self.charm.on.update_status
 
         self.framework.observe(refresh_event, self._handle_refresh)
 
     def _handle_refresh(self, event: Any):
-        """Subclasses should handle this event in scenarios where an endpoint IP may change."""
-        pass
+        """Re-emit as a refresh event in scenarios where an endpoint IP may change."""
+        self.on.refresh.emit()  # type: ignore
 
 
 class SingleAuthObjectStorageProvider(_ObjectStorageProviderBase):
@@ -426,9 +537,6 @@ class SingleAuthObjectStorageProvider(_ObjectStorageProviderBase):
         # We don't do anything on upgrades or leader-elected yet.
         self.on.refresh.emit()  # type: ignore
 
-    def _handle_refresh(self, event):
-        self.on.refresh.emit()  # type: ignore
-
     def _request_endpoints(self, event: Any) -> None:
         """Handler triggered on pretty much all events.
 
@@ -443,33 +551,33 @@ class SingleAuthObjectStorageProvider(_ObjectStorageProviderBase):
         if not self.charm.unit.is_leader():
             return
 
-        if event.relation and event.relation.app:
-            bucket = event.relation.data.get(event.relation.app, {}).get(
-                "bucket", f"{event.relation.app.name}-{event.relation.id}"
-            )
+        rel = event.relation
+        app = rel.app if rel else None
+        if rel and app:
+            bucket = rel.data.get(app, {}).get("bucket") or f"{app.name}-{rel.id}"
         else:
             bucket = "anonymous"
-        self.on.requested.emit(event.relation, bucket=bucket)  # type: ignore
+        self.on.requested.emit(rel, bucket=bucket)  # type: ignore
 
     def update_endpoints(self, data: Dict[str, str], relation_id: Optional[int] = None):
         """Update relation data bags with endpoint information."""
         if relation_id:
-            for r in [rel for rel in self.relations if rel.id == relation_id]:
-                if bucket := r.data.get(r.app, {}).get("bucket", ""):  # type: ignore
-                    data["bucket"] = bucket
-                    _validate_data(data, ANONYMOUS_OBJECT_STORAGE_REQUIRES_APP_SCHEMA)
-                    r.data[self.charm.app].update(data)  # type: ignore
+            relation = self.charm.model.get_relation(self.relation_name, relation_id)
+            rels = [relation] if relation else []
         else:
-            for r in self.relations:
-                if bucket := r.data.get(r.app, {}).get("bucket", ""):  # type: ignore
-                    data["bucket"] = bucket
-                    _validate_data(data, ANONYMOUS_OBJECT_STORAGE_REQUIRES_APP_SCHEMA)
-                    r.data[self.charm.app].update(data)  # type: ignore
+            rels = self.relations
+        my_app = self.charm.app
+        for r in rels:
+            if bucket := r.data.get(r.app, {}).get("bucket", ""):  # type: ignore
+                data["bucket"] = bucket
+                _validate_data(data, ANONYMOUS_OBJECT_STORAGE_REQUIRES_APP_SCHEMA)
+                r.data[my_app].update(data)  # type: ignore
 
 
 class ObjectStorageReadyEvent(_ObjectStorageEvent):
     """Event representing that object storage data has been provided for an app."""
 
+    __slots__ = ("bucket", "endpoint", "access_key", "secret_key")
     __args__ = ("bucket", "endpoint", "access_key", "secret_key")
 
     if typing.TYPE_CHECKING:
@@ -482,6 +590,8 @@ class ObjectStorageReadyEvent(_ObjectStorageEvent):
 class ObjectStorageBrokenEvent(_ObjectStorageEvent):
     """Event representing that an object storage relation has been broken."""
 
+    __slots__ = ()
+
 
 class ObjectStorageRequirerCharmEvents(ObjectEvents):
     """List of events that the object storage requirer charm can leverage."""
@@ -524,26 +634,31 @@ class ObjectStorageRequirer(_ObjectStorageBase):
                 provided, {model.name}-{app.name} will be used.
         """
         super().__init__(charm, relation_name)
-        self._stored.set_default(current_endpoints={})
+        # A flat string fingerprint keeps the state-get/state-set payload tiny
+        # compared to round-tripping the whole endpoints dict.
+        self._stored.set_default(endpoints_fingerprint="", written_bucket="")
         self.bucket = bucket or f"{charm.model.name}-{charm.app.name}"
+        # Endpoints read from relation data, cached for the lifetime of one hook
+        # invocation: each read costs a `relation-get` round-trip plus validation,
+        # and charms typically inspect `bucket_info` right after our own handler ran.
+        self._endpoints_cache: Optional[Dict[str, str]] = None
 
     @property
     def relation(self) -> Optional[Relation]:
         """The established Relation instance, or None if still unrelated."""
-        return self.relations[0] if self.relations else None
+        rels = self.charm.model.relations[self.relation_name]
+        return rels[0] if rels else None
 
     def _handle_relation(self, event: RelationEvent):
         # we calculate the diff between the urls we were aware of
         # before and those we know now
-        previous_endpoints = self._stored.current_endpoints or {}  # type: ignore
+        self._endpoints_cache = None  # relation data may just have changed
+        previous_fingerprint = self._stored.endpoints_fingerprint or ""  # type: ignore
         current_endpoints = self._endpoints_from_relation_data
-        self._stored.current_endpoints = current_endpoints  # type: ignore
+        current_fingerprint = _endpoints_fingerprint(current_endpoints)
+        self._stored.endpoints_fingerprint = current_fingerprint  # type: ignore
 
-        if isinstance(event, RelationBrokenEvent):
-            self._stored.current_endpoints = {}
-            return
-
-        changed = previous_endpoints != current_endpoints
+        changed = previous_fingerprint != current_fingerprint
         if changed:
             self.on.ready.emit(  # type: ignore
                 event.relation,
@@ -553,10 +668,20 @@ class ObjectStorageRequirer(_ObjectStorageBase):
                 current_endpoints["secret-key"],
             )
             return
-        event.relation.data[self.charm.app]["bucket"] = self.bucket
+        # Re-requesting the bucket costs a relation-set per hook; only write it
+        # when it actually differs from what we last sent, and only as leader
+        # (followers cannot write the app databag anyway).
+        if self.charm.unit.is_leader() and self._stored.written_bucket != self.bucket:
+            event.relation.data[self.charm.app]["bucket"] = self.bucket
+            self._stored.written_bucket = self.bucket
 
     def _handle_relation_broken(self, event):
         """Emit an event the parent charm can listen to."""
+        self._endpoints_cache = None
+        self._stored.endpoints_fingerprint = ""
+        # A future relation starts from an empty databag, so the bucket must
+        # be re-requested even if the name is unchanged.
+        self._stored.written_bucket = ""
         self.on.broken.emit(event.relation)  # type: ignore
 
     @property
@@ -566,22 +691,28 @@ class ObjectStorageRequirer(_ObjectStorageBase):
 
     @property
     def _endpoints_from_relation_data(self) -> Dict[str, str]:
-        """Pull connection information out of relation data."""
+        """Pull connection information out of relation data, caching per hook."""
+        if self._endpoints_cache is None:
+            self._endpoints_cache = self._read_endpoints()
+        return self._endpoints_cache
+
+    def _read_endpoints(self) -> Dict[str, str]:
+        """Read and validate connection information from relation data."""
         relation = self.relation
         if not relation:
             return {}
 
-        if not relation.app and not relation.app.name:  # type: ignore
+        app = relation.app
+        if app is None:
             # We must be in a relation_broken hook
             return {}
-        assert isinstance(relation.app, Application)
+        assert isinstance(app, Application)
 
         data = {}
         try:
-            fields = ["access-key", "bucket", "endpoint", "secret-key"]
-
-            for f in fields:
-                data[f] = relation.data[relation.app].get(f, "")  # type: ignore
+            remote_data = relation.data[app]
+            for f in _REQUIRER_FIELDS:
+                data[f] = remote_data.get(f, "")
         except ModelError as e:
             logger.debug(
                 "Error {} attempting to read remote app data; "
@@ -589,7 +720,7 @@ class ObjectStorageRequirer(_ObjectStorageBase):
             )
             return {}
 
-        if not all([data[k] for k in data.keys()]):
+        if not all(data.values()):
             # incomplete relation data
             return {}
 
@@ -6,10 +6,13 @@
 
 """A Juju Charmed Operator for Mimir."""
 
+import io
+import json
 import logging
-import os
-import re
 import socket
+import tarfile
+from functools import cached_property
+from hashlib import sha256
 from typing import Optional
 
 import yaml
@@ -24,12 +27,19 @@ from charms.prometheus_k8s.v0.prometheus_remote_write import PrometheusRemoteWri
 from charms.prometheus_k8s.v0.prometheus_scrape import MetricsEndpointProvider
 from charms.s3proxy_k8s.v0.object_storage import ObjectStorageRequirer
 from ops.charm import CharmBase
+from ops.framework import StoredState
 from ops.main import main
 from ops.model import ActiveStatus, BlockedStatus, WaitingStatus
 from ops.pebble import Error as PebbleError
 from ops.pebble import Layer, PathError, ProtocolError
 
+# The libyaml bindings are 7-8x faster than the pure-Python implementation
+# that yaml.safe_dump defaults to; fall back when they are not compiled in.
+SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 MIMIR_CONFIG = "/etc/mimir/mimir-config.yaml"
+ALERTS_HASH_PATH = "/etc/mimir/alerts.sha256"
+RULES_TAR_PATH = "/tmp/mimir-rules.tar"
 MIMIR_DIR = "/mimir"
 
 # Ruler dirs cannot overlap, otherwise mimir complains:
@@ -37,6 +47,13 @@ MIMIR_DIR = "/mimir"
 # the configured ruler storage local directory "/mimir/rules"; please set different paths, also
 # ensuring one is not a subdirectory of the other one
 RULES_DIR = f"{MIMIR_DIR}/rules"
+# Without multitenancy, the default tenant is `anonymous`, and the ruler checks
+# under {RULES_DIR}/<tenant_id>
+TENANT_RULES_DIR = f"{RULES_DIR}/anonymous"
+FILESYSTEM_DATA_DIR = f"{MIMIR_DIR}/data"
+TSDB_SYNC_DIR = f"{MIMIR_DIR}/tsdb-sync"
+TSDB_DIR = f"{MIMIR_DIR}/tsdb"
+COMPACTOR_DATA_DIR = f"{MIMIR_DIR}/compactor"
 
 logger = logging.getLogger(__name__)
 
@@ -48,35 +65,37 @@ class MimirK8SOperatorCharm(CharmBase):
     _http_listen_port = 9009
     _instance_addr = "127.0.0.1"
 
+    _stored = StoredState()
+
     def __init__(self, *args):
         super().__init__(*args)
         self._container = self.unit.get_container(self._name)
+        self._mimir_config_cache: Optional[tuple] = None
+        self._tenant_dir_ensured = False
+        self._stored.set_default(
+            layer_installed=False,
+            svc_patched=False,
+            alerts_hash=None,
+            rule_digests={},
+            config_hash=None,
+            mimir_version="",
+            mimir_version_mtime="",
+        )
 
         self.topology = JujuTopology.from_charm(self)
 
-        self.service_patch = KubernetesServicePatch(
-            self, [ServicePort(self._http_listen_port, name=self.app.name)]
-        )
+        # Once the service patch has been verified in the cluster there is no
+        # point re-checking it (a Kubernetes API round-trip) on every hook; the
+        # port list is static. upgrade-charm clears the flag so a new revision
+        # re-applies the patch.
+        if not self._stored.svc_patched:
+            self.service_patch = KubernetesServicePatch(
+                self, [ServicePort(self._http_listen_port, name=self.app.name)]
+            )
+            self.framework.observe(self.on.update_status, self._verify_svc_patch)
+        self.framework.observe(self.on.upgrade_charm, self._reset_svc_patch)
 
-        self.metrics_provider = MetricsEndpointProvider(
-            self,
-            jobs=[
-                {
-                    "static_configs": [
-                        {
-                            "targets": [f"*:{self._http_listen_port}"],
-                            "labels": {
-                                "cluster": self.topology.model_uuid,
-                                "namespace": self.topology.model,
-                                "job": f"{self.topology.model}/mimir",
-                                "pod": self.topology.unit,
-                            },
-                        }
-                    ],
-                    "scrape_interval": "15s",
-                }
-            ],
-        )
+        self.metrics_provider = MetricsEndpointProvider(self, jobs=self._scrape_jobs)
 
         self.remote_write_provider = PrometheusRemoteWriteProvider(
             charm=self,
@@ -106,6 +125,16 @@ class MimirK8SOperatorCharm(CharmBase):
         self.framework.observe(self.on.config_changed, self._on_config_changed)
         self.framework.observe(self.on.stop, self._on_stop)
 
+    def _verify_svc_patch(self, _):
+        try:
+            if self.service_patch.is_patched():
+                self._stored.svc_patched = True
+        except Exception as e:
+            logger.debug("Could not verify the Kubernetes service patch: %s", e)
+
+    def _reset_svc_patch(self, _):
+        self._stored.svc_patched = False
+
     def _on_config_changed(self, event):
         self._configure_mimir(event)
 
@@ -117,6 +146,11 @@ class MimirK8SOperatorCharm(CharmBase):
         self._configure_mimir(event)
 
     def _on_mimir_pebble_ready(self, event):
+        # The container may just have restarted, losing dynamically added layers
+        # and possibly the pushed files; reconcile everything from scratch.
+        self._stored.layer_installed = False
+        self._stored.alerts_hash = None
+        self._stored.config_hash = None
         self._set_mimir_version()
         self._configure_mimir(event)
 
@@ -125,6 +159,11 @@ class MimirK8SOperatorCharm(CharmBase):
 
         Returns: True if Pebble layer was added, otherwise False.
         """
+        # Once our (static) layer is in the plan it stays there for the life of
+        # the container, so skip the get_plan round-trip on subsequent hooks.
+        if self._stored.layer_installed:
+            return False
+
         current_layer = self._container.get_plan()
         new_layer = self._pebble_layer
 
@@ -133,12 +172,40 @@ class MimirK8SOperatorCharm(CharmBase):
             or current_layer.services != new_layer.services
         ):
             self._container.add_layer(self._name, new_layer, combine=True)
+            self._stored.layer_installed = True
             return True
 
+        self._stored.layer_installed = True
         return False
 
-    @property
+    @cached_property
+    def _topology_labels(self):
+        # Topology is stable for the unit's lifetime; resolve its attributes once.
+        topology = self.topology
+        return {
+            "cluster": topology.model_uuid,
+            "namespace": topology.model,
+            "job": f"{topology.model}/mimir",
+            "pod": topology.unit,
+        }
+
+    @cached_property
+    def _scrape_jobs(self):
+        return [
+            {
+                "static_configs": [
+                    {
+                        "targets": [f"*:{self._http_listen_port}"],
+                        "labels": self._topology_labels,
+                    }
+                ],
+                "scrape_interval": "15s",
+            }
+        ]
+
+    @cached_property
     def _pebble_layer(self):
+        # Depends only on constants, so build the Layer once per process.
         return Layer(
             {
                 "summary": "mimir layer",
@@ -169,12 +236,26 @@ class MimirK8SOperatorCharm(CharmBase):
         if not self._container.can_connect():
             return None
 
+        # The binary only changes across upgrades, so key the cached version
+        # on its mtime: a stat round-trip is much cheaper than an exec.
+        try:
+            mtime = self._container.list_files("/bin/mimir")[0].last_modified.isoformat()
+        except (PebbleError, IndexError):
+            # A missing binary surfaces as APIError; fall through to the exec.
+            mtime = ""
+        if mtime and mtime == self._stored.mimir_version_mtime and self._stored.mimir_version:
+            return self._stored.mimir_version
+
         version_output, _ = self._container.exec(["/bin/mimir", "-version"]).wait_output()
         # Output looks like this:
         # Mimir, version 2.4.0 (branch: HEAD, revision: 32137ee)
-        if result := re.search(r"[Vv]ersion:?\s*(\S+)", version_output):
-            return result.group(1)
-        return None
+        # The format is fixed, so a partition beats compiling a regex per call.
+        after = version_output.partition("version ")[2]
+        version = after.split(None, 1)[0] if after else None
+        if version and mtime:
+            self._stored.mimir_version = version
+            self._stored.mimir_version_mtime = mtime
+        return version
 
     def _configure_mimir(self, event):
         if not self._container.can_connect():
@@ -185,12 +266,11 @@ class MimirK8SOperatorCharm(CharmBase):
             # TODO when we stop using `local`, mimir would require an API call or mimirtool to
             #  reload any newly pushed rules.
             self._set_alerts()
-            restart = any(
-                [
-                    self._pebble_layer_changed(),
-                    self._mimir_config_changed(),
-                ]
-            )
+            # Both checks must run (each pushes its own state when stale), so
+            # bind the results rather than short-circuiting or building a list.
+            layer_changed = self._pebble_layer_changed()
+            config_changed = self._mimir_config_changed()
+            restart = layer_changed or config_changed
         except BlockedStatusError as e:
             self.unit.status = BlockedStatus(e.message)
             return
@@ -209,28 +289,44 @@ class MimirK8SOperatorCharm(CharmBase):
         Raises: BlockedStatusError exception if PebbleError, ProtocolError, PathError exceptions
             are raised by container.remove_path
         """
-        config = self._build_mimir_config()
+        config_as_yaml = self._mimir_config_yaml()
+        new_hash = sha256(config_as_yaml.encode()).hexdigest()
 
         try:
-            if self._running_mimir_config() != config:
-                config_as_yaml = yaml.safe_dump(config)
-                self._container.push(MIMIR_CONFIG, config_as_yaml, make_dirs=True)
-                logger.info("Pushed new Mimir configuration")
-                return True
-
-            return False
+            if self._stored.config_hash is not None:
+                unchanged = self._stored.config_hash == new_hash
+            else:
+                # Cold mirror (fresh process or container restart): reconcile
+                # against the file actually present in the container.
+                unchanged = self._running_config_hash() == new_hash
+            if unchanged:
+                self._stored.config_hash = new_hash
+                return False
+
+            self._container.push(MIMIR_CONFIG, config_as_yaml, make_dirs=True)
+            self._stored.config_hash = new_hash
+            logger.info("Pushed new Mimir configuration")
+            return True
         except (ProtocolError, Exception) as e:
             logger.error("Failed to push updated config file: %s", e)
             raise BlockedStatusError(str(e))
 
     def _build_mimir_config(self) -> dict:
-        if s3 := self.object_storage.bucket_info:
+        # The config depends only on the object storage endpoints; memoize on
+        # those so repeated builds within one dispatch don't redo the dict work.
+        s3_info = self.object_storage.bucket_info
+        cache_key = tuple(sorted(s3_info.items())) if s3_info else ()
+        if self._mimir_config_cache is not None and self._mimir_config_cache[0] == cache_key:
+            return self._mimir_config_cache[1]
+
+        if s3 := s3_info:
+            endpoint = s3["endpoint"]
             common_storage = {
                 "backend": "s3",
                 "s3": {
                     # mimir doesn't like fully qualified paths, which differs from the s3
                     # relation spec
-                    "endpoint": re.sub(r"^http://(.*)", r"\1", s3["endpoint"]),
+                    "endpoint": endpoint[7:] if endpoint.startswith("http://") else endpoint,
                     "access_key_id": s3["access-key"],
                     "secret_access_key": s3["secret-key"],
                     "bucket_name": s3["bucket"],
@@ -238,22 +334,22 @@ class MimirK8SOperatorCharm(CharmBase):
                 },
             }
         else:
-            common_storage = {"backend": "filesystem", "filesystem": {"dir": f"{MIMIR_DIR}/data"}}
+            common_storage = {"backend": "filesystem", "filesystem": {"dir": FILESYSTEM_DATA_DIR}}
 
-        return {
+        config = {
             "multitenancy_enabled": False,
             "common": {"storage": {**common_storage}},
             "blocks_storage": {
                 "storage_prefix": "tsdb",
                 "bucket_store": {
-                    "sync_dir": f"{MIMIR_DIR}/tsdb-sync",
+                    "sync_dir": TSDB_SYNC_DIR,
                 },
                 "tsdb": {
-                    "dir": f"{MIMIR_DIR}/tsdb",
+                    "dir": TSDB_DIR,
                 },
             },
             "compactor": {
-                "data_dir": f"{MIMIR_DIR}/compactor",
+                "data_dir": COMPACTOR_DATA_DIR,
                 "sharding_ring": {"kvstore": {"store": "memberlist"}},
             },
             "distributor": {
@@ -283,22 +379,51 @@ class MimirK8SOperatorCharm(CharmBase):
                 "sharding_ring": {"replication_factor": 1},
             },
         }
+        self._mimir_config_cache = (cache_key, config, None)
+        return config
+
+    def _mimir_config_yaml(self) -> str:
+        """Serialized form of the current Mimir config, memoized alongside it.
 
-    def _running_mimir_config(self) -> dict:
+        Keeps the generic YAML representer walk to once per distinct config
+        instead of once per hook.
+        """
+        config = self._build_mimir_config()
+        cache_key, cached_config, cached_yaml = self._mimir_config_cache  # type: ignore
+        if cached_yaml is None:
+            cached_yaml = yaml.dump(config, Dumper=SafeDumper)
+            self._mimir_config_cache = (cache_key, cached_config, cached_yaml)
+        return cached_yaml
+
+    def _running_config_hash(self) -> str:
+        """SHA-256 of the config currently in the container, or "" if unavailable.
+
+        We always push exactly the text we serialize, so hashing the raw file
+        is enough to detect drift. The pulled file is digested in chunks to
+        keep peak memory bounded regardless of the config size.
+        """
         if not self._container.can_connect():
             logger.debug("Could not connect to Mimir container")
-            return {}
+            return ""
+
+        # On first pebble-ready the file does not exist yet; probe first so
+        # the common cold-start case is a cheap RPC rather than an exception.
+        if not self._container.exists(MIMIR_CONFIG):
+            return ""
 
         try:
-            raw_current = self._container.pull(MIMIR_CONFIG).read()
-            return yaml.safe_load(raw_current)
+            hasher = sha256()
+            with self._container.pull(MIMIR_CONFIG) as f:
+                while chunk := f.read(8192):
+                    hasher.update(chunk.encode() if isinstance(chunk, str) else chunk)
+            return hasher.hexdigest()
         except (ProtocolError, PathError) as e:
             logger.warning(
                 "Could not check the current Mimir configuration due to "
                 "a failure in retrieving the file: %s",
                 e,
             )
-            return {}
+            return ""
 
     def _set_alerts(self) -> None:
         """(Re-)create alert rule files for all Mimir consumers.
@@ -307,40 +432,122 @@ class MimirK8SOperatorCharm(CharmBase):
         Raises: BlockedStatusError exception if PebbleError, ProtocolError, PathError exceptions
             are raised by container.remove_path
         """
+        alerts = self.remote_write_provider.alerts()  # type: ignore
+        digests = {
+            topology_identifier: sha256(
+                json.dumps(rules_file, sort_keys=True, separators=(",", ":")).encode()
+            ).hexdigest()
+            for topology_identifier, rules_file in alerts.items()
+        }
+        alerts_hash = self._alerts_hash(digests)
+
+        # The teardown/re-push cycle costs a Pebble round-trip per rules file;
+        # skip it entirely when the content is already in place.
+        rules_in_place = self._container.exists(RULES_DIR)
+        if alerts_hash == self._current_alerts_hash() and rules_in_place:
+            return
+
+        # Only serialize and push files whose content actually changed, and
+        # remove just the files whose consumer went away. If the rules dir is
+        # gone (container restart), everything is considered changed.
+        previous_digests = dict(self._stored.rule_digests) if rules_in_place else {}
+        changed = {
+            topology_identifier: rules_file
+            for topology_identifier, rules_file in alerts.items()
+            if previous_digests.get(topology_identifier) != digests[topology_identifier]
+        }
+        stale = [
+            topology_identifier
+            for topology_identifier in previous_digests
+            if topology_identifier not in digests
+        ]
+
         try:
-            self._container.remove_path(RULES_DIR, recursive=True)
+            for topology_identifier in stale:
+                self._container.remove_path(
+                    f"{TENANT_RULES_DIR}/juju_{topology_identifier}.rules", recursive=True
+                )
         except PebbleError as e:
             logger.error("Failed to remove alerts directory: %s", e)
             raise BlockedStatusError("Failed to remove alerts directory; see debug logs")
 
         try:
-            self._push_alert_rules(self.remote_write_provider.alerts())  # type: ignore
-        except (ProtocolError, PathError) as e:
+            self._push_alert_rules(changed)
+            self._container.push(ALERTS_HASH_PATH, alerts_hash, make_dirs=True)
+            self._stored.alerts_hash = alerts_hash
+            self._stored.rule_digests = digests
+        except PebbleError as e:
             logger.error("Failed to push updated alert files: %s", e)
             raise BlockedStatusError("Failed to push updated alert files; see debug logs")
 
+    def _current_alerts_hash(self) -> str:
+        """The hash recorded for the alert rules currently in the container.
+
+        Mirrored in StoredState so the steady-state path costs no Pebble
+        round-trip; the container file is only consulted when the mirror is
+        cold (fresh process after restart or pebble-ready).
+        """
+        if self._stored.alerts_hash is not None:
+            return self._stored.alerts_hash
+        try:
+            current = self._container.pull(ALERTS_HASH_PATH).read()
+        except (ProtocolError, PathError):
+            current = ""
+        self._stored.alerts_hash = current
+        return current
+
+    @staticmethod
+    def _alerts_hash(digests) -> str:
+        """Combined content hash over the per-file rule digests.
+
+        Stable across processes regardless of dict ordering.
+        """
+        hasher = sha256()
+        for topology_identifier in sorted(digests):
+            hasher.update(topology_identifier.encode())
+            hasher.update(b"\x00")
+            hasher.update(digests[topology_identifier].encode())
+        return hasher.hexdigest()
+
     def _push_alert_rules(self, alerts):
         """Push alert rules from a rules file to the mimir container.
 
+        All rules files are batched into a single tar upload followed by one
+        extraction, instead of one Pebble round-trip per file.
+
         Args:
             alerts: a dictionary of alert rule files.
         """
-        # Without multitenancy, the default is `anonymous`, and the ruler checks under
-        # {RULES_DIR}/<tenant_id>
-        tenant_dir = f"{RULES_DIR}/anonymous"
         # Need to `make_dir` even though we have `make_dirs=True` below
         # https://github.com/canonical/operator/issues/898
-        self._container.make_dir(tenant_dir, make_parents=True)
-        for topology_identifier, rules_file in alerts.items():
-            filename = f"juju_{topology_identifier}.rules"
-            path = os.path.join(tenant_dir, filename)
-            rules = yaml.safe_dump(rules_file)
-            self._container.push(path, rules, make_dirs=True)
-            logger.debug("Updated alert rules file %s/%s", path, filename)
+        if not self._tenant_dir_ensured:
+            self._container.make_dir(TENANT_RULES_DIR, make_parents=True)
+            self._tenant_dir_ensured = True
+        if not alerts:
+            return
 
-    @property
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w") as tar:
+            for topology_identifier, rules_file in alerts.items():
+                filename = f"juju_{topology_identifier}.rules"
+                rules = yaml.dump(rules_file, Dumper=SafeDumper).encode()
+                info = tarfile.TarInfo(filename)
+                info.size = len(rules)
+                tar.addfile(info, io.BytesIO(rules))
+                logger.debug("Staged alert rules file %s/%s", TENANT_RULES_DIR, filename)
+
+        # /tmp always exists, so skip the parent-directory handling on push.
+        self._container.push(RULES_TAR_PATH, buffer.getvalue())
+        self._container.exec(["tar", "-xf", RULES_TAR_PATH, "-C", TENANT_RULES_DIR]).wait()
+        self._container.remove_path(RULES_TAR_PATH)
+
+    @cached_property
     def hostname(self) -> str:
-        """Unit's hostname."""
+        """Unit's hostname.
+
+        getfqdn can block on a reverse DNS lookup, so resolve it once per
+        process rather than on every access.
+        """
         return socket.getfqdn()
 
 
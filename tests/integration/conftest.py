@@ -5,6 +5,7 @@ import logging
 from collections import defaultdict
 from datetime import datetime
 
+import aiohttp
 import pytest
 from pytest_operator.plugin import OpsTest
 
@@ -56,6 +57,19 @@ async def mimir_charm(ops_test: OpsTest):
     return charm
 
 
+@pytest.fixture(scope="module")
+async def http_session():
+    """One pooled HTTP session shared by every workload probe in a module."""
+    session = aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=5),
+        connector=aiohttp.TCPConnector(
+            limit=32, limit_per_host=16, keepalive_timeout=120, enable_cleanup_closed=True
+        ),
+    )
+    yield session
+    await session.close()
+
+
 @pytest.fixture(scope="module", autouse=True)
 async def model_config(ops_test: OpsTest):
     await ops_test.model.set_config(
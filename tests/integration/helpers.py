@@ -2,6 +2,7 @@
 # See LICENSE file for licensing details.
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -31,6 +32,16 @@ async def get_address(ops_test: OpsTest, app_name: str, unit_num: Optional[int]
     )
 
 
+@lru_cache(maxsize=8)
+def _load_metadata(metadata_file: str) -> dict:
+    """Parse a charm metadata file, caching per path.
+
+    Several test modules resolve images from the same metadata.yaml at import
+    time; parse it once per session instead of once per caller.
+    """
+    return yaml.safe_load(Path(metadata_file).read_text())
+
+
 def oci_image(metadata_file: str, image_name: str) -> str:
     """Find upstream source for a container image.
 
@@ -45,7 +56,7 @@ def oci_image(metadata_file: str, image_name: str) -> str:
         FileNotFoundError: if metadata_file path is invalid
         ValueError: if upstream source for image name can not be found
     """
-    metadata = yaml.safe_load(Path(metadata_file).read_text())
+    metadata = _load_metadata(metadata_file)
 
     resources = metadata.get("resources", {})
     if not resources:
@@ -46,9 +46,9 @@ async def test_deploy_and_relate_charms(ops_test: OpsTest, mimir_charm):
 
 
 @pytest.mark.abort_on_fail
-async def test_rules_are_loaded(ops_test):
+async def test_rules_are_loaded(ops_test, http_session):
     address = await get_address(ops_test, mimir.name, 0)
-    client = Mimir(host=address)
+    client = Mimir(host=address, session=http_session)
 
     # Get rule change poll interval (default is '1m0s')
     config = yaml.safe_load(await client.api_request("/config"))
@@ -73,9 +73,9 @@ async def test_rules_are_loaded(ops_test):
 
 
 @pytest.mark.abort_on_fail
-async def test_alerts_are_fired(ops_test):
+async def test_alerts_are_fired(ops_test, http_session):
     address = await get_address(ops_test, mimir.name, 0)
-    client = Mimir(host=address)
+    client = Mimir(host=address, session=http_session)
 
     # Get evaluation interval (default is '1m0s')
     config = yaml.safe_load(await client.api_request("/config"))
@@ -49,9 +49,9 @@ async def test_deploy_and_relate_charms(ops_test: OpsTest, mimir_charm):
 
 
 @pytest.mark.abort_on_fail
-async def test_object_storage_propagates(ops_test):
+async def test_object_storage_propagates(ops_test, http_session):
     address = await get_address(ops_test, mimir.name, 0)
-    client = Mimir(host=address)
+    client = Mimir(host=address, session=http_session)
 
     logger.info("Waiting for avalanche to push.")
     await asyncio.sleep(75)
@@ -5,8 +5,8 @@
 import asyncio
 import logging
 
+import aiohttp
 import pytest
-import requests
 from helpers import get_address, oci_image
 from pytest_operator.plugin import OpsTest
 from workload import Mimir
@@ -42,9 +42,9 @@ async def test_deploy_and_relate_charms(ops_test: OpsTest, mimir_charm):
     await ops_test.model.wait_for_idle(apps=apps, status="active")
 
 
-async def test_metrics_are_available(ops_test):
+async def test_metrics_are_available(ops_test, http_session):
     address = await get_address(ops_test, MIMIR, 0)
-    mimir = Mimir(host=address)
+    mimir = Mimir(host=address, session=http_session)
     metrics = await mimir.api_request("/metrics")
     assert len(metrics) > 0
 
@@ -53,10 +53,13 @@ async def test_query_metrics_from_prometheus(ops_test):
     address = await get_address(ops_test, PROMETHEUS, 0)
     url = f"http://{address}:9090/api/v1/query"
     params = {"query": f"up{{juju_application='{MIMIR}'}}"}
+    timeout = aiohttp.ClientTimeout(total=5)
     try:
-        response = requests.get(url, params=params)
-        assert response.json()["status"] == "success"
-        for result in response.json()["data"]["result"]:
-            assert "1" in result["value"]
-    except requests.exceptions.RequestException:
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with session.get(url, params=params) as response:
+                result = await response.json()
+        assert result["status"] == "success"
+        for sample in result["data"]["result"]:
+            assert "1" in sample["value"]
+    except aiohttp.ClientError:
         assert False
@@ -3,7 +3,8 @@
 # See LICENSE file for licensing details.
 
 import logging
-from typing import Dict, Literal, Optional
+import time
+from typing import Dict, Literal, Optional, Tuple
 from urllib.parse import urljoin
 
 import aiohttp
@@ -14,30 +15,83 @@ logger = logging.getLogger(__name__)
 class Mimir:
     """A class that represents a running instance of Mimir."""
 
-    def __init__(self, host="localhost", port=9009):
+    def __init__(
+        self, host="localhost", port=9009, session: Optional[aiohttp.ClientSession] = None
+    ):
         """Utility to manage a Mimir application.
 
         Args:
             host: Optional; host address of Mimir application.
             port: Optional; port on which Mimir service is exposed.
+            session: Optional; shared HTTP session to use instead of owning
+                one, so several Mimir instances can pool connections.
         """
         self.base_url = f"http://{host}:{port}"
+        self._ready_url = f"{self.base_url}/ready"
+        self._config_url = f"{self.base_url}/config"
 
         # Set a timeout of 5 second - should be sufficient for all the checks here.
         # The default (5 min) prolongs itests unnecessarily.
         self.timeout = aiohttp.ClientTimeout(total=5)
 
+        # One session for the lifetime of this object: repeated probes reuse
+        # the pooled connection instead of re-handshaking per request.
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+
+        # Short TTL caches so tight polling/assertion loops don't re-issue
+        # identical requests within the same window.
+        self._ready_cache: Optional[Tuple[float, bool]] = None
+        self._config_cache: Optional[Tuple[float, str]] = None
+
+    def invalidate(self):
+        """Drop cached responses so the next probe hits the workload."""
+        self._ready_cache = None
+        self._config_cache = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            # Readiness polls can sleep longer than aiohttp's 15 s default
+            # keep-alive, which would silently drop the pooled socket and
+            # re-handshake on the next probe; keep it warm across the gap.
+            self._session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                connector=aiohttp.TCPConnector(
+                    limit=16,
+                    limit_per_host=16,
+                    keepalive_timeout=120,
+                    enable_cleanup_closed=True,
+                ),
+            )
+            self._owns_session = True
+        return self._session
+
+    async def aclose(self):
+        """Close the underlying HTTP session, if this object owns one."""
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self) -> "Mimir":
+        """Enter the async context, returning this helper."""
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Close the owned HTTP session on context exit."""
+        await self.aclose()
+
     async def is_ready(self) -> bool:
         """Send a GET request to check readiness.
 
         Returns:
           True if Mimir is ready (returned 200 OK); False otherwise.
         """
-        url = f"{self.base_url}/ready"
-
-        async with aiohttp.ClientSession(timeout=self.timeout) as session:
-            async with session.get(url) as response:
-                return response.status == 200
+        if self._ready_cache is not None and time.monotonic() - self._ready_cache[0] < 0.5:
+            return self._ready_cache[1]
+        session = await self._get_session()
+        async with session.get(self._ready_url) as response:
+            ready = response.status == 200
+        self._ready_cache = (time.monotonic(), ready)
+        return ready
 
     async def config(self) -> str:
         """Send a GET request to get Mimir configuration.
@@ -45,7 +99,6 @@ class Mimir:
         Returns:
           YAML config in string format or empty string
         """
-        url = f"{self.base_url}/config"
         # Response looks like this:
         # {
         #   "status": "success",
@@ -68,22 +121,29 @@ class Mimir:
         #       - localhost:9090\n"
         #   }
         # }
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                result = await response.text()
-                return result if response.status == 200 else ""
+        if self._config_cache is not None and time.monotonic() - self._config_cache[0] < 5.0:
+            return self._config_cache[1]
+        session = await self._get_session()
+        async with session.get(self._config_url) as response:
+            result = await response.text() if response.status == 200 else ""
+        self._config_cache = (time.monotonic(), result)
+        return result
 
     async def api_request(
         self,
         endpoint: str,
-        response_type: Optional[Literal["json"]] = None,
-        params: Optional[Dict] = {},
+        response_type: Optional[Literal["json", "bytes"]] = None,
+        params: Optional[Dict] = None,
     ):
+        session = await self._get_session()
         url = urljoin(self.base_url, endpoint)
-        async with aiohttp.ClientSession() as session:
-            async with session.request("GET", url, params=params) as response:
-                if response_type == "json":
-                    result = await response.json()
-                    return result if response.status == 200 else ""
-                result = await response.text()
-                return result if response.status == 200 else ""
+        async with session.get(url, params=params or None) as response:
+            # Check the status before touching the body so error payloads are
+            # never decoded just to be thrown away.
+            if response.status != 200:
+                return ""
+            if response_type == "json":
+                return await response.json()
+            if response_type == "bytes":
+                return await response.read()
+            return await response.text()
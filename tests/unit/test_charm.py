@@ -3,82 +3,81 @@
 #
 # Learn more about testing at: https://juju.is/docs/sdk/testing
 
-import unittest
-from unittest.mock import Mock, PropertyMock, patch
+from unittest.mock import Mock, patch
 
 import ops.testing
+import pytest
 from charm import BlockedStatusError, MimirK8SOperatorCharm
 from ops.model import ActiveStatus, BlockedStatus, Container, WaitingStatus
 from ops.pebble import ProtocolError
 from ops.testing import Harness
 
-ops.testing.SIMULATE_CAN_CONNECT = True
-
-
-class TestCharm(unittest.TestCase):
-    @patch("charm.KubernetesServicePatch", lambda x, y: None)
-    @patch("lightkube.core.client.GenericSyncClient")
-    def setUp(self, *_):
-        self.container_name: str = "mimir"
-        self.harness = Harness(MimirK8SOperatorCharm)
-        patcher = patch.object(MimirK8SOperatorCharm, "_mimir_version", new_callable=PropertyMock)
-        self.mock_version = patcher.start()
-        self.mock_version.return_value = "2.4.0"
-        self.addCleanup(patcher.stop)
-        self.harness.begin()
-
-    @patch("charm.MimirK8SOperatorCharm._running_mimir_config", new_callable=Mock)
-    @patch("charm.MimirK8SOperatorCharm._set_alerts", new_callable=Mock)
-    def test_pebble_ready_and_config_ok(self, mock_set_alerts, mock_running_mimir_config):
-        mock_set_alerts.return_value = True
-        mock_running_mimir_config.return_value = {}
-        expected_plan = {
-            "services": {
-                "mimir": {
-                    "override": "replace",
-                    "summary": "mimir daemon",
-                    "command": "/bin/mimir --config.file=/etc/mimir/mimir-config.yaml",
-                    "startup": "enabled",
-                }
-            },
+_EXPECTED_PLAN = {
+    "services": {
+        "mimir": {
+            "override": "replace",
+            "summary": "mimir daemon",
+            "command": "/bin/mimir --config.file=/etc/mimir/mimir-config.yaml",
+            "startup": "enabled",
         }
+    },
+}
 
-        self.harness.container_pebble_ready("mimir")
-        updated_plan = self.harness.get_container_pebble_plan("mimir").to_dict()
-        self.assertEqual(expected_plan, updated_plan)
-        service = self.harness.model.unit.get_container("mimir").get_service("mimir")
-        self.assertTrue(service.is_running())
-        self.assertEqual(self.harness.model.unit.status, ActiveStatus())
-
-    @patch("charm.MimirK8SOperatorCharm._set_alerts", new_callable=Mock)
-    def test_set_alerts_error(self, mock_set_alerts):
-        mock_set_alerts.side_effect = BlockedStatusError(
-            "Failed to remove alerts directory; see debug logs"
-        )
-        self.harness.container_pebble_ready("mimir")
-        self.assertEqual(
-            self.harness.model.unit.status,
-            BlockedStatus("Failed to remove alerts directory; see debug logs"),
-        )
-
-    def test_config_changed_cannot_connect(self):
-        ops.testing.SIMULATE_CAN_CONNECT = False
-        self.harness.update_config({"cpu": "256"})
-        self.assertEqual(self.harness.model.unit.status, WaitingStatus("Waiting for Pebble ready"))
-
-    @patch.object(Container, "push")
-    @patch("charm.MimirK8SOperatorCharm._running_mimir_config", new_callable=Mock)
-    @patch("charm.MimirK8SOperatorCharm._set_alerts", new_callable=Mock)
-    def test_mimir_pebble_ready_cannot_push_config(
-        self, mock_set_alerts, mock_running_mimir_config, mock_push
+
+@pytest.fixture(autouse=True)
+def mimir_version(monkeypatch):
+    # A plain attribute shadows the property descriptor and is cheaper than a
+    # PropertyMock; no current test needs call-counting on the version read.
+    monkeypatch.setattr(MimirK8SOperatorCharm, "_mimir_version", "2.4.0")
+
+
+@pytest.fixture
+def harness():
+    ops.testing.SIMULATE_CAN_CONNECT = True
+    with patch("charm.KubernetesServicePatch", lambda x, y: None), patch(
+        "lightkube.core.client.GenericSyncClient"
     ):
-        mock_set_alerts.return_value = True
-        mock_running_mimir_config.return_value = {}
-        mock_push.side_effect = ProtocolError("Message")
+        harness = Harness(MimirK8SOperatorCharm)
+        harness.begin()
+    yield harness
+    harness.cleanup()
+    ops.testing.SIMULATE_CAN_CONNECT = True
+
+
+def test_pebble_ready_and_config_ok(harness, monkeypatch):
+    monkeypatch.setattr(MimirK8SOperatorCharm, "_set_alerts", Mock(return_value=True))
+    monkeypatch.setattr(MimirK8SOperatorCharm, "_running_config_hash", Mock(return_value=""))
+    harness.container_pebble_ready("mimir")
+    updated_plan = harness.get_container_pebble_plan("mimir").to_dict()
+    assert _EXPECTED_PLAN == updated_plan
+    service = harness.model.unit.get_container("mimir").get_service("mimir")
+    assert service.is_running()
+    assert harness.model.unit.status == ActiveStatus()
+
+
+def test_set_alerts_error(harness, monkeypatch):
+    monkeypatch.setattr(
+        MimirK8SOperatorCharm,
+        "_set_alerts",
+        Mock(side_effect=BlockedStatusError("Failed to remove alerts directory; see debug logs")),
+    )
+    harness.container_pebble_ready("mimir")
+    assert harness.model.unit.status == BlockedStatus(
+        "Failed to remove alerts directory; see debug logs"
+    )
+
+
+def test_config_changed_cannot_connect(harness):
+    ops.testing.SIMULATE_CAN_CONNECT = False
+    harness.update_config({"cpu": "256"})
+    assert harness.model.unit.status == WaitingStatus("Waiting for Pebble ready")
+
 
-        self.harness.container_pebble_ready("mimir")
-        self.assertIsInstance(self.harness.model.unit.status, BlockedStatus)
+@pytest.mark.parametrize("push_error", [ProtocolError("Message"), Exception()])
+def test_mimir_pebble_ready_cannot_push_config(harness, monkeypatch, push_error):
+    monkeypatch.setattr(MimirK8SOperatorCharm, "_set_alerts", Mock(return_value=True))
+    monkeypatch.setattr(MimirK8SOperatorCharm, "_running_config_hash", Mock(return_value=""))
+    monkeypatch.setattr(Container, "push", Mock(side_effect=push_error))
 
-        mock_push.side_effect = Exception()
-        self.harness.container_pebble_ready("mimir")
-        self.assertIsInstance(self.harness.model.unit.status, BlockedStatus)
+    harness.container_pebble_ready("mimir")
+    assert isinstance(harness.model.unit.status, BlockedStatus)